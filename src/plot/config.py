@@ -1,6 +1,9 @@
-config = {
+from types import MappingProxyType
+
+# Read-only plot defaults; per-line entries are tuples
+config = MappingProxyType({
     # The list of default line colors
-    "color": [
+    "color": (
         "#1f77b4",
         "#ff7f0e",
         "#2ca02c",
@@ -11,9 +14,9 @@ config = {
         "#7f7f7f",
         "#bcbd22",
         "#17becf",
-    ],
+    ),
     # The colorbar properties
-    "params": {
+    "params": MappingProxyType({
         "cmap": "viridis",
         "log": False,
         "vmin": None,
@@ -22,7 +25,7 @@ config = {
         "show": True,
         "cbar": True,
         "norm": None,
-    },
+    }),
     # The default image height (in pixels)
     "height":
     533,
@@ -37,7 +40,7 @@ config = {
     "aspect":
     "auto",
     # Make list of markers for matplotlib
-    "marker": [
+    "marker": (
         "o",
         "^",
         "s",
@@ -59,9 +62,9 @@ config = {
         "+",
         "x",
         "D",
-    ],
+    ),
     # Default line width for 1D plots
-    "linewidth": [1.5],
+    "linewidth": (1.5, ),
     # Default line style for 1D non-histogram plots
-    "linestyle": ["none"],
-}
+    "linestyle": ("none", ),
+})
@@ -2,11 +2,14 @@
 # Copyright (c) 2020 Scipp contributors (https://github.com/scipp)
 # @author Neil Vaytet
 
-from .plot_1d import plot_1d
-from .plot_2d import plot_2d
+# Delayed imports: the plotting modules are only loaded on first use
 # from .plot_3d import plot_3d
 # from .events import histogram_events_data
 
+# Default projection for a given number of dimensions; data with more than
+# two dimensions is shown as 2d with sliders.
+_DEFAULT_PROJECTIONS = {1: "1d", 2: "2d"}
+
 
 def dispatch(data_arrays,
              ndim=0,
@@ -35,17 +38,17 @@ def dispatch(data_arrays,
         data_arrays = events_dict
 
     if projection is None:
-        if ndim < 3:
-            projection = "{}d".format(ndim)
-        else:
-            projection = "2d"
-    projection = projection.lower()
+        projection = _DEFAULT_PROJECTIONS.get(ndim, "2d")
+    else:
+        projection = projection.lower()
 
     if projection == "1d":
+        from .plot_1d import plot_1d
         return plot_1d(data_arrays,
                        mpl_line_params=mpl_line_params,
                        **kwargs)
     elif projection == "2d":
+        from .plot_2d import plot_2d
         return plot_2d(data_arrays, **kwargs)
     elif projection == "3d":
         return plot_3d(data_arrays, **kwargs)
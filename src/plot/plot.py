@@ -10,6 +10,25 @@ from .tools import make_fake_coord
 from .dispatch import dispatch
 from .tools import get_line_param
 
+
+# Resolvers for the different kinds of user-supplied line parameters. Each
+# returns the parameter for a given variable name and line index.
+def _line_param_from_index(param, name, index):
+    return index
+
+
+def _line_param_from_list(param, name, index):
+    return param[index]
+
+
+def _line_param_from_dict(param, name, index):
+    return param.get(name, index)
+
+
+def _line_param_from_scalar(param, name, index):
+    return param
+
+
 def plot(dict_obj,
          projection=None,
          axes=None,
@@ -29,21 +48,20 @@ def plot(dict_obj,
 
     inventory = {}
 
-
-    if ({"coords", "data"}.issubset(set(dict_obj.keys())) or
-        {"coords", "unaligned"}.issubset(set(dict_obj.keys()))):
+    # Classify the input by probing the dict directly for its keys
+    if "coords" in dict_obj and ("data" in dict_obj
+                                 or "unaligned" in dict_obj):
         # Case of a DataArray-like dict
         inventory[dict_obj["name"]] = dict_obj
-    elif ({"dims", "values"}.issubset(set(dict_obj.keys())) or
-          {"dims", "shape"}.issubset(set(dict_obj.keys()))):
+    elif "dims" in dict_obj and ("values" in dict_obj
+                                 or "shape" in dict_obj):
         # Case of a Variable-like dict
         coords = {}
         for dim, size in zip(dict_obj["dims"], dict_obj["shape"]):
             coords[dim] = make_fake_coord(dim, size)
         data_array = {"data": dict_obj, "coords": coords, "masks": {},
         "attrs": {}}
-        for key in dict_obj.keys():
-            data_array[key] = dict_obj[key]
+        data_array.update(dict_obj)
         # print(data_array)
         inventory["variable"] = data_array
     else:
@@ -102,6 +120,19 @@ def plot(dict_obj,
         "linewidth": linewidth
     }
 
+    # Classify the line parameters once, outside of the loop over variables
+    line_param_resolvers = []
+    for n, p in line_params.items():
+        if p is None:
+            resolve = _line_param_from_index
+        elif isinstance(p, list):
+            resolve = _line_param_from_list
+        elif isinstance(p, dict):
+            resolve = _line_param_from_dict
+        else:
+            resolve = _line_param_from_scalar
+        line_param_resolvers.append((n, resolve, p))
+
     # Counter for 1d/event data
     line_count = -1
 
@@ -112,66 +143,66 @@ def plot(dict_obj,
     # tobeplotted is a dict that holds four items:
     # {number_of_dimensions, Dataset, axes, line_parameters}.
     tobeplotted = dict()
-    for name, var in sorted(inventory.items()):
+    for name in sorted(inventory):
+        var = inventory[name]
 
         # if sc.contains_events(var) and bins is None:
         #     raise RuntimeError("The `bins` argument must be specified when "
         #                        "plotting event data.")
 
-        ndims = len(var["data"]["dims"])
+        vdata = var["data"]
+        vdims = vdata["dims"]
+        ndims = len(vdims)
         # if bins is not None and sc.contains_events(var):
         #     ndims += 1
         if ndims > 0:
             ax = axes
             if ndims == 1 or projection == "1d" or projection == "1D":
-                # Construct a key from the dimensions
+                # Construct a key from the dimensions. The key is a tuple,
+                # which is only joined into a string once per group below.
                 if axes is not None:
                     # Check if we are dealing with a dict mapping dimensions to
                     # labels
                     if isinstance(axes, dict):
-                        key = axes[str(var.dims[0])]
-                        ax = [key]
+                        label = axes[str(vdims[0])]
+                        key = (label, )
+                        ax = [label]
                     else:
-                        key = ".".join(axes)
+                        key = tuple(axes)
                 else:
-                    key = ".".join([str(dim) for dim in var["data"]["dims"]])
+                    key = tuple(str(dim) for dim in vdims)
                 # Add unit to key
-                key = "{}.{}".format(key, str(var["data"]["unit"]))
+                key += (str(vdata["unit"]), )
                 line_count += 1
             else:
                 key = name
 
             mpl_line_params = {}
-            for n, p in line_params.items():
-                if p is None:
-                    mpl_line_params[n] = line_count
-                elif isinstance(p, list):
-                    mpl_line_params[n] = p[line_count]
-                elif isinstance(p, dict):
-                    if name in p:
-                        mpl_line_params[n] = p[name]
-                    else:
-                        mpl_line_params[n] = line_count
-                else:
-                    mpl_line_params[n] = p
-                if isinstance(mpl_line_params[n], int):
-                    mpl_line_params[n] = get_line_param(
-                        name=n, index=mpl_line_params[n])
-
-            if key not in tobeplotted.keys():
-                tobeplotted[key] = dict(ndims=ndims,
-                                        data_arrays={},
-                                        axes=ax,
-                                        mpl_line_params={})
-                for n in mpl_line_params.keys():
-                    tobeplotted[key]["mpl_line_params"][n] = {}
-            tobeplotted[key]["data_arrays"][name] = inventory[name]
+            for n, resolve, p in line_param_resolvers:
+                val = resolve(p, name, line_count)
+                if isinstance(val, int):
+                    val = get_line_param(name=n, index=val)
+                mpl_line_params[n] = val
+
+            entry = tobeplotted.get(key)
+            if entry is None:
+                entry = tobeplotted[key] = dict(
+                    ndims=ndims,
+                    data_arrays={},
+                    axes=ax,
+                    mpl_line_params={n: {}
+                                     for n in mpl_line_params})
+            entry["data_arrays"][name] = var
+            entry_line_params = entry["mpl_line_params"]
             for n, p in mpl_line_params.items():
-                tobeplotted[key]["mpl_line_params"][n][name] = p
+                entry_line_params[n][name] = p
 
-    # Plot all the subsets
-    output = SciPlot()
+    # Plot all the subsets. The results are collected in a plain dict and
+    # wrapped in a SciPlot once at the end.
+    output = {}
     for key, val in tobeplotted.items():
+        if isinstance(key, tuple):
+            key = ".".join(key)
         output[key] = dispatch(data_arrays=val["data_arrays"],
                                name=key,
                                ndim=val["ndims"],
@@ -181,4 +212,4 @@ def plot(dict_obj,
                                bins=bins,
                                **kwargs)
 
-    return output
+    return SciPlot(output)
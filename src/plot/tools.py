@@ -7,7 +7,12 @@ from .config import config
 # from .._scipp import core as sc
 
 # Other imports
+from functools import lru_cache
 import numpy as np
+from matplotlib.colors import Normalize, LogNorm, LinearSegmentedColormap
+
+# Snapshot of the default colorbar parameters, copied by parse_params
+_DEFAULT_PARAMS = dict(config["params"])
 
 
 def get_line_param(name=None, index=None):
@@ -36,8 +41,14 @@ def centers_to_edges(x):
             dx = 0.5
         return np.array([x[0] - dx, x[0] + dx])
     else:
-        e = edges_to_centers(x)
-        return np.concatenate([[2.0 * x[0] - e[0]], e, [2.0 * x[-1] - e[-1]]])
+        # Fill a single preallocated buffer rather than computing the
+        # centers and concatenating the end points onto them
+        out = np.empty(len(x) + 1, dtype=np.result_type(x, 0.5))
+        np.add(x[1:], x[:-1], out=out[1:-1])
+        out[1:-1] *= 0.5
+        out[0] = 2.0 * x[0] - out[1]
+        out[-1] = 2.0 * x[-1] - out[-2]
+        return out
 
 
 def parse_params(params=None,
@@ -50,9 +61,7 @@ def parse_params(params=None,
     """
     Construct the colorbar settings using default and input values
     """
-    from matplotlib.colors import Normalize, LogNorm, LinearSegmentedColormap
-
-    parsed = dict(config["params"])
+    parsed = _DEFAULT_PARAMS.copy()
     if defaults is not None:
         for key, val in defaults.items():
             parsed[key] = val
@@ -68,6 +77,14 @@ def parse_params(params=None,
         for key, val in params.items():
             parsed[key] = val
 
+    # On a log scale, user-supplied vmin/vmax are exponents. Convert them
+    # once to data values, which is what the limits found from the data and
+    # the norm use.
+    if parsed["log"]:
+        for key in ("vmin", "vmax"):
+            if parsed[key] is not None:
+                parsed[key] = 10.0**parsed[key]
+
     need_norm = False
     # TODO: sc.min/max currently return nan if the first value in the
     # variable array is a nan. Until sc.nanmin/nanmax are implemented, we fall
@@ -80,13 +97,17 @@ def parse_params(params=None,
         need_norm = True
 
     if need_norm:
+        # Limits are None when the data has no valid values. Fall back to
+        # the known limits then, and only leave them unset if both are
+        # missing.
         if min_val is not None:
-            parsed["vmin"] = min(parsed["vmin"], min_val)
+            parsed["vmin"] = min_val if parsed["vmin"] is None else min(
+                parsed["vmin"], min_val)
         if max_val is not None:
-            parsed["vmax"] = max(parsed["vmax"], max_val)
+            parsed["vmax"] = max_val if parsed["vmax"] is None else max(
+                parsed["vmax"], max_val)
         if parsed["log"]:
-            norm = LogNorm(vmin=10.0**parsed["vmin"],
-                           vmax=10.0**parsed["vmax"])
+            norm = LogNorm(vmin=parsed["vmin"], vmax=parsed["vmax"])
         else:
             norm = Normalize(vmin=parsed["vmin"], vmax=parsed["vmax"])
         parsed["norm"] = norm
@@ -104,9 +125,13 @@ def make_fake_coord(dim, size, unit=None):
     # if unit is not None:
     #     args["unit"] = unit
     # return sc.Variable(dims=[dim], **args)
+    # Use 32-bit integers when possible to halve the size of the coordinate
+    values = np.arange(size,
+                       dtype=np.int32 if size <= np.iinfo(np.int32).max
+                       else np.int64)
     return {"dims": [dim], "shape": [size],
-            "values": np.arange(size), "variances": None,
-            "unit": unit, "dtype": np.int}
+            "values": values, "variances": None,
+            "unit": unit, "dtype": str(values.dtype)}
 
 
 # "dims": _dims_to_strings(v.dims),
@@ -117,17 +142,36 @@ def make_fake_coord(dim, size, unit=None):
 #             "dtype": str(v.dtype)}
 
 
+def _finite_min_max(array, positive):
+    """
+    Find the min and max of the finite values in an array. If `positive` is
+    True, only strictly positive values are considered. If there are no such
+    values, both limits are None.
+    """
+    if array.size == 0:
+        return None, None
+    # Nans and infs propagate into the min/max, so if both are finite (and
+    # positive when required), every value is valid and no mask is needed.
+    vmin, vmax = array.min(), array.max()
+    if np.isfinite(vmin) and np.isfinite(vmax) and (vmin > 0 or not positive):
+        return vmin, vmax
+    select = np.isfinite(array)
+    if positive:
+        select &= array > 0
+    valid = array[select]
+    if valid.size == 0:
+        return None, None
+    return valid.min(), valid.max()
+
+
 def _find_min_max(array, params):
     if params["vmin"] is None or params["vmax"] is None:
-        if params["log"]:
-            with np.errstate(divide="ignore", invalid="ignore"):
-                valid = np.ma.log10(array)
-        else:
-            valid = np.ma.masked_invalid(array, copy=False)
-    if params["vmin"] is None:
-        params["vmin"] = valid.min()
-    if params["vmax"] is None:
-        params["vmax"] = valid.max()
+        # Exclude nans and infs, and non-positive values for log scales
+        vmin, vmax = _finite_min_max(array, bool(params["log"]))
+        if params["vmin"] is None:
+            params["vmin"] = vmin
+        if params["vmax"] is None:
+            params["vmax"] = vmax
 
 
 def name_with_unit(var=None, name=None, log=False): #, replace_dim=True):
@@ -150,14 +194,24 @@ def name_with_unit(var=None, name=None, log=False): #, replace_dim=True):
     return text
 
 
+@lru_cache(maxsize=16)
+def _scientific_thresholds(precision):
+    """
+    Get the upper and lower absolute values beyond which a number is
+    displayed in scientific notation.
+    """
+    return 10.0**(precision + 1), 10.0**(-precision - 1)
+
+
 def value_to_string(val, precision=3):
     """
     Convert a number to a human readable string.
     """
     if (not isinstance(val, float)) or (val == 0):
-        text = str(val)
-    elif (abs(val) >= 10.0**(precision+1)) or \
-         (abs(val) <= 10.0**(-precision-1)):
+        return str(val)
+    upper, lower = _scientific_thresholds(precision)
+    absval = abs(val)
+    if (absval >= upper) or (absval <= lower):
         text = "{val:.{prec}e}".format(val=val, prec=precision)
     else:
         text = "{}".format(val)